@@ -7,6 +7,7 @@
 
 import path from "path";
 import chalk from "chalk";
+import { toEntity } from "./escape-entities.js";
 
 /**
  * Escapes text for safe inclusion in content
@@ -14,15 +15,7 @@ import chalk from "chalk";
  */
 function escapeText(text) {
   if (typeof text !== "string") return String(text);
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;")
-    .replace(/'/g, "&#x27;")
-    .replace(/:/g, "&#x3A;") // P0-005: Escape colons to prevent javascript: injection
-    .replace(/\\/g, "&#x5C;") // Escape backslashes for security
-    .replace(/\//g, "&#x2F;"); // Escape forward slashes for security
+  return text.replace(/[&<>"':\\/]/g, toEntity);
 }
 
 /**
@@ -4,7 +4,6 @@ import chalk from "chalk";
 import ora from "ora";
 import fs from "fs/promises";
 import path from "path";
-import os from "os";
 import { verifyClaudeSetup } from "./setup-diagnostics.js";
 import { getClaudeConfigPath } from "./config-analyzer.js";
 import {
@@ -12,6 +11,7 @@ import {
   generateSetupVerificationContent,
   formatTroubleshootingGuidance,
 } from "./brain-connection-ux.js";
+import { toEntity } from "./escape-entities.js";
 
 /**
  * Escapes text for safe markdown rendering
@@ -20,15 +20,7 @@ import {
  */
 function escapeMarkdown(text) {
   if (typeof text !== "string") return String(text);
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;")
-    .replace(/'/g, "&#x27;")
-    .replace(/:/g, "&#x3A;") // P0-003: Escape colons to prevent javascript: injection
-    .replace(/\\/g, "&#x5C;") // Escape backslashes for security
-    .replace(/\//g, "&#x2F;"); // Escape forward slashes for security (script tags, etc.)
+  return text.replace(/[&<>"':\\/]/g, toEntity);
 }
 
 /**
@@ -39,15 +31,30 @@ function escapeMarkdownPath(text) {
   if (typeof text !== "string") return String(text);
   // Only escape dangerous characters but keep paths readable by NOT escaping forward slashes
   // This is safe when used in controlled template contexts (not user input)
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;")
-    .replace(/'/g, "&#x27;")
-    .replace(/\\/g, "&#x5C;");
+  return text.replace(/[&<>"'\\]/g, toEntity);
 }
 
+/**
+ * Patterns that mark text as potentially malicious, fused into one
+ * alternation so detection is a single scan of the text
+ * P0-008: Enhanced malicious pattern detection
+ */
+const DANGEROUS_PATTERN = new RegExp(
+  [
+    "<script",
+    "<\\/script",
+    "<img",
+    "onerror=",
+    "javascript:",
+    "vbscript:",
+    "data:.*script",
+    "on\\w+=", // P0-008: Event handler attributes
+    "<iframe", // P0-008: Iframe injection
+    "style\\s*=", // P0-008: Style attribute injection
+  ].join("|"),
+  "i"
+);
+
 /**
  * Smart escaping that detects potentially malicious content
  * REQ-401: Use human-readable escaping for clean paths, full escaping for malicious content
@@ -57,34 +64,14 @@ function escapeMarkdownPath(text) {
 function escapePathSmart(text) {
   if (typeof text !== "string") return String(text);
 
-  // Check if the text contains potentially malicious patterns
-  const dangerousPatterns = [
-    /<script/i,
-    /<\/script/i,
-    /<img/i,
-    /onerror=/i,
-    /javascript:/i,
-    /vbscript:/i,
-    /data:.*script/i,
-    /on\w+=/i, // P0-008: Event handler attributes
-    /<iframe/i, // P0-008: Iframe injection
-    /style\s*=/i, // P0-008: Style attribute injection
-  ];
-
-  const isMalicious = dangerousPatterns.some((pattern) => pattern.test(text));
-
   // If potentially malicious, use full escaping
-  if (isMalicious) {
+  if (DANGEROUS_PATTERN.test(text)) {
     return escapeMarkdown(text);
   }
 
   // P0-008: For legitimate paths, preserve readability by NOT escaping forward slashes
   // REQ-401: Keep paths human-readable for copy-paste functionality
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;");
+  return text.replace(/[&<>"]/g, toEntity);
   // Note: Forward slashes (/) are NOT escaped to maintain path readability
 }
 
@@ -319,8 +306,7 @@ export async function waitForClaudeConnection(projectPath, timeoutMs = 300000) {
     const scheduleNextCheck = () => {
       intervalId = setTimeout(async () => {
         try {
-          // Check if file exists and is readable
-          await fs.access(statusFilePath);
+          // A missing file rejects with ENOENT and falls through to the retry path
           const content = await fs.readFile(statusFilePath, "utf8");
 
           // Validate JSON before parsing
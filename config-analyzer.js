@@ -151,22 +151,19 @@ export function analyzeMcpServers(config) {
   const serverConfigs = config.mcpServers;
 
   // Detect specific server types
-  const hasFilesystem = servers.some(
-    (name) =>
-      name.toLowerCase().includes("filesystem") ||
-      name.toLowerCase().includes("file")
+  // Lowercase each name once rather than once per check
+  const lowerServers = servers.map((name) => name.toLowerCase());
+
+  const hasFilesystem = lowerServers.some(
+    (name) => name.includes("filesystem") || name.includes("file")
   );
 
-  const hasContext7 = servers.some(
-    (name) =>
-      name.toLowerCase().includes("context7") ||
-      name.toLowerCase().includes("context")
+  const hasContext7 = lowerServers.some(
+    (name) => name.includes("context7") || name.includes("context")
   );
 
-  const hasGitHub = servers.some(
-    (name) =>
-      name.toLowerCase().includes("github") ||
-      name.toLowerCase().includes("git")
+  const hasGitHub = lowerServers.some(
+    (name) => name.includes("github") || name.includes("git")
   );
 
   // Extract workspace paths from filesystem server
@@ -18,6 +18,7 @@ vi.mock("chalk", () => ({
 describe("REQ-005: Dev-Mode Deprecation Descriptions", () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    vi.mocked(fs.stat).mockResolvedValue({ size: 1024 });
     console.log = vi.fn();
     console.error = vi.fn();
     console.warn = vi.fn();
@@ -135,6 +136,7 @@ describe("REQ-005: Dev-Mode Deprecation Descriptions", () => {
 describe("REQ-004: Claude Settings Guidance Display", () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    vi.mocked(fs.stat).mockResolvedValue({ size: 1024 });
     console.log = vi.fn();
     console.error = vi.fn();
     console.warn = vi.fn();
@@ -57,6 +57,24 @@ const FILE_TYPE_DETECTORS = [
   { file: "go.mod", type: "Go" },
 ];
 
+const MAX_LISTED_DIRECTORIES = 10;
+const MAX_CONFIG_SIZE = 1024 * 1024;
+
+const SERVER_DESCRIPTIONS = {
+  memory:
+    "Save and recall project context, decisions, and important information",
+  "brave-search":
+    "Search the web for current information and documentation",
+  context7:
+    "Look up documentation for libraries and frameworks (deprecated - use Claude Settings → Extensions)",
+  tavily: "Research and analyze topics with AI-powered search",
+  supabase: "Interact with Supabase databases and APIs",
+  github:
+    "GitHub integration (deprecated - use Claude Settings → Connectors → GitHub)",
+  filesystem:
+    "File system access (deprecated - use Claude Settings → Extensions → Filesystem)",
+};
+
 async function detectProjectType(projectPath) {
   try {
     const packageJsonPath = path.join(projectPath, "package.json");
@@ -90,32 +108,19 @@ async function detectProjectType(projectPath) {
 
 async function getMCPServerInfo(configPath) {
   try {
-    const configContent = await fs.readFile(configPath, "utf-8");
-    if (configContent.length > 1024 * 1024) {
+    // Check the size first so an oversized file is never read into memory
+    const { size } = await fs.stat(configPath);
+    if (size > MAX_CONFIG_SIZE) {
       throw new Error("Config file too large");
     }
 
+    const configContent = await fs.readFile(configPath, "utf-8");
     const config = JSON.parse(configContent);
     const servers = config.mcpServers || {};
 
-    const serverDescriptions = {
-      memory:
-        "Save and recall project context, decisions, and important information",
-      "brave-search":
-        "Search the web for current information and documentation",
-      context7:
-        "Look up documentation for libraries and frameworks (deprecated - use Claude Settings → Extensions)",
-      tavily: "Research and analyze topics with AI-powered search",
-      supabase: "Interact with Supabase databases and APIs",
-      github:
-        "GitHub integration (deprecated - use Claude Settings → Connectors → GitHub)",
-      filesystem:
-        "File system access (deprecated - use Claude Settings → Extensions → Filesystem)",
-    };
-
     return Object.keys(servers).map((name) => ({
       name,
-      description: serverDescriptions[name] || "Custom MCP server",
+      description: SERVER_DESCRIPTIONS[name] || "Custom MCP server",
     }));
   } catch (error) {
     console.warn(
@@ -335,18 +340,21 @@ async function generateDirectoryStructure(projectPath) {
   try {
     const validatedPath = validateProjectPath(projectPath);
     const items = await fs.readdir(validatedPath, { withFileTypes: true });
-    const dirs = items
-      .filter(
-        (item) =>
-          item.isDirectory() &&
-          !item.name.startsWith(".") &&
-          item.name !== "node_modules"
-      )
-      .slice(0, 10)
-      .map((dir) => `- \`${dir.name}/\``)
-      .join("\n");
 
-    return dirs || "- Project files in root directory";
+    // Single pass over the Dirent list: stop as soon as the cap is reached
+    const dirs = [];
+    for (const item of items) {
+      if (
+        item.isDirectory() &&
+        !item.name.startsWith(".") &&
+        item.name !== "node_modules"
+      ) {
+        dirs.push(`- \`${item.name}/\``);
+        if (dirs.length >= MAX_LISTED_DIRECTORIES) break;
+      }
+    }
+
+    return dirs.join("\n") || "- Project files in root directory";
   } catch (error) {
     console.warn(
       chalk.yellow(
@@ -28,6 +28,7 @@ describe("dev-mode", () => {
     vi.mocked(fs.writeFile).mockReset();
     vi.mocked(fs.readdir).mockReset();
     vi.mocked(fs.access).mockReset();
+    vi.mocked(fs.stat).mockResolvedValue({ size: 1024 });
     console.log = vi.fn();
     console.error = vi.fn();
     console.warn = vi.fn();
@@ -145,11 +146,10 @@ describe("dev-mode", () => {
     });
 
     test("REQ-105 — limits config file size to prevent memory exhaustion", async () => {
-      const largeConfig = "x".repeat(2 * 1024 * 1024); // 2MB config
-
+      vi.mocked(fs.stat).mockResolvedValue({ size: 2 * 1024 * 1024 }); // 2MB config
       vi.mocked(fs.readFile).mockImplementation(async (filePath) => {
         if (filePath.includes("claude_desktop_config.json")) {
-          return largeConfig;
+          return JSON.stringify({ mcpServers: { memory: {} } });
         }
         return JSON.stringify({ dependencies: {} });
       });
@@ -160,8 +160,15 @@ describe("dev-mode", () => {
 
       await generateClaudeIntegration();
 
+      // The size check rejects the config before it is ever read
+      const configReads = vi
+        .mocked(fs.readFile)
+        .mock.calls.filter((call) =>
+          call[0].includes("claude_desktop_config.json")
+        );
+      expect(configReads).toHaveLength(0);
       expect(console.warn).toHaveBeenCalledWith(
-        expect.stringContaining("Could not read MCP config")
+        expect.stringContaining("Config file too large")
       );
     });
 
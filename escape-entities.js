@@ -0,0 +1,19 @@
+/**
+ * HTML entity replacements shared by the escaping helpers in
+ * brain-connection.js, brain-connection-ux.js and setup-diagnostics.js
+ * Each helper matches its own character class in a single replace() pass
+ * and maps hits through toEntity
+ */
+
+export const ESCAPE_ENTITIES = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+  "'": "&#x27;",
+  ":": "&#x3A;", // P0-005: Escape colons to prevent javascript: injection
+  "\\": "&#x5C;", // Escape backslashes for security
+  "/": "&#x2F;", // Escape forward slashes for security (script tags, etc.)
+};
+
+export const toEntity = (char) => ESCAPE_ENTITIES[char];
@@ -52,6 +52,31 @@ const loadDependencies = async () => {
   return { program, chalk, fs, path, os };
 };
 
+// REQ-SEC-002: Comprehensive sanitization for all injection vectors
+// Use a mapping approach to avoid semicolon conflicts
+const SANITIZE_CHAR_MAP = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+  "'": "&apos;",
+  "/": "[SLASH]",
+  "\\": "[BACKSLASH]",
+  $: "[DOLLAR]",
+  "`": "[BACKTICK]",
+  "|": "[PIPE]",
+  ";": "[SEMICOLON]",
+  ":": "[COLON]",
+  "(": "[LPAREN]",
+  ")": "[RPAREN]",
+  ".": "[DOT]",
+  " ": "[SPACE]",
+  "\t": "[TAB]",
+  "\n": "[NEWLINE]",
+  "\r": "[CR]",
+};
+const ALPHANUMERIC_CHAR = /[a-zA-Z0-9]/;
+
 // REQ-PERF-006: Performance-optimized banner display
 function showBanner(chalk) {
   console.log(
@@ -213,14 +238,22 @@ async function initializeCLI() {
           ];
           console.log(chalk.yellow("\nContext Files:"));
 
-          for (const file of contextFiles) {
-            try {
-              await fs.access(path.join(workspacePath, file));
+          // Probe all files concurrently, then report in list order
+          const present = await Promise.all(
+            contextFiles.map((file) =>
+              fs.access(path.join(workspacePath, file)).then(
+                () => true,
+                () => false
+              )
+            )
+          );
+          contextFiles.forEach((file, i) => {
+            if (present[i]) {
               console.log(chalk.green(`  ✓ ${file}`));
-            } catch {
+            } else {
               console.log(chalk.gray(`  - ${file}`));
             }
-          }
+          });
         } catch {
           console.log(chalk.red(`  ✗ Workspace not found`));
         }
@@ -293,37 +326,14 @@ async function initializeCLI() {
       return "[invalid-input]";
     }
 
-    // REQ-SEC-002: Comprehensive sanitization for all injection vectors
-    // Use a mapping approach to avoid semicolon conflicts
-    const charMap = {
-      "&": "&amp;",
-      "<": "&lt;",
-      ">": "&gt;",
-      '"': "&quot;",
-      "'": "&apos;",
-      "/": "[SLASH]",
-      "\\": "[BACKSLASH]",
-      $: "[DOLLAR]",
-      "`": "[BACKTICK]",
-      "|": "[PIPE]",
-      ";": "[SEMICOLON]",
-      ":": "[COLON]",
-      "(": "[LPAREN]",
-      ")": "[RPAREN]",
-      ".": "[DOT]",
-      " ": "[SPACE]",
-      "\t": "[TAB]",
-      "\n": "[NEWLINE]",
-      "\r": "[CR]",
-    };
-
     let result = "";
     for (let i = 0; i < input.length && i < 50; i++) {
       const char = input[i];
       // Also sanitize any character that's not alphanumeric
-      if (charMap[char]) {
-        result += charMap[char];
-      } else if (/[a-zA-Z0-9]/.test(char)) {
+      const mapped = SANITIZE_CHAR_MAP[char];
+      if (mapped) {
+        result += mapped;
+      } else if (ALPHANUMERIC_CHAR.test(char)) {
         result += char;
       } else {
         result += `[CHAR${char.charCodeAt(0)}]`;
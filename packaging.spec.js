@@ -21,6 +21,7 @@ describe("REQ-311: Package Distribution Integrity", () => {
       "setup-diagnostics.js",
       "brain-connection-ux.js",
       "brain-connection.js",
+      "escape-entities.js",
       "setup.js",
       "index.js",
     ];
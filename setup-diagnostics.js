@@ -16,6 +16,7 @@ import {
   parseClaudeDesktopConfig,
   analyzeMcpServers,
 } from "./config-analyzer.js";
+import { toEntity } from "./escape-entities.js";
 
 /**
  * Built-in tools that should NOT be validated through MCP configuration
@@ -30,6 +31,7 @@ const BUILT_IN_TOOLS = new Set([
   "github",
   "git",
 ]);
+const BUILT_IN_TOOL_LIST = [...BUILT_IN_TOOLS];
 
 /**
  * Test built-in Claude Desktop features through direct tool calls
@@ -113,11 +115,10 @@ export async function validateMcpServersOnly(configPath = null) {
 
     for (const [serverName, serverConfig] of Object.entries(mcpServers)) {
       // Check if this is a built-in tool that should be skipped
+      const lowerName = serverName.toLowerCase();
       const isBuiltIn =
-        BUILT_IN_TOOLS.has(serverName.toLowerCase()) ||
-        Array.from(BUILT_IN_TOOLS).some((tool) =>
-          serverName.toLowerCase().includes(tool)
-        );
+        BUILT_IN_TOOLS.has(lowerName) ||
+        BUILT_IN_TOOL_LIST.some((tool) => lowerName.includes(tool));
 
       if (isBuiltIn) {
         result.skippedServers.push(serverName);
@@ -161,14 +162,7 @@ export async function validateMcpServersOnly(configPath = null) {
  */
 function escapeText(text) {
   if (typeof text !== "string") return String(text);
-  return text
-    .replace(/&/g, "&amp;")
-    .replace(/</g, "&lt;")
-    .replace(/>/g, "&gt;")
-    .replace(/"/g, "&quot;")
-    .replace(/'/g, "&#x27;")
-    .replace(/\//g, "&#x2F;")
-    .replace(/\\/g, "&#x5C;");
+  return text.replace(/[&<>"'/\\]/g, toEntity);
 }
 
 /**
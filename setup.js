@@ -1,13 +1,10 @@
 #!/usr/bin/env node
 
 import chalk from "chalk";
-import ora from "ora";
-import inquirer from "inquirer";
 import fs from "fs/promises";
 import path from "path";
 import os from "os";
 import { fileURLToPath } from "url";
-import initiateBrainConnection from "./brain-connection.js";
 
 // Get package directory for template resolution
 const __filename = fileURLToPath(import.meta.url);
@@ -108,6 +105,13 @@ Evaluate every request:
 };
 
 async function setupQuickstart() {
+  // Lazy load interactive dependencies so importing this module for its
+  // config helpers stays cheap
+  const [{ default: ora }, { default: inquirer }] = await Promise.all([
+    import("ora"),
+    import("inquirer"),
+  ]);
+
   console.log(chalk.cyan("\n\n🚀 Setting up Claude MCP integration...\n"));
   console.log(chalk.gray("Memory server will be configured automatically\n"));
 
@@ -116,7 +120,7 @@ async function setupQuickstart() {
   try {
     // Get config path and load existing config
     const configPath = getConfigPath();
-    const existingConfig = await loadExistingConfig();
+    const existingConfig = await loadExistingConfig(configPath);
     let config = existingConfig;
 
     spinner.succeed("Configuration loaded");
@@ -309,12 +313,7 @@ async function setupQuickstart() {
     try {
       config = validateAndMergeConfig(config, servers);
 
-      // Save config with atomic write
-      const configPath = getConfigPath();
-      const tempConfigPath = `${configPath}.tmp`;
-
-      await fs.writeFile(tempConfigPath, JSON.stringify(config, null, 2));
-      await fs.rename(tempConfigPath, configPath);
+      await writeConfigAtomically(configPath, config);
 
       spinner.succeed("MCP servers configured");
     } catch (error) {
@@ -357,7 +356,7 @@ async function setupQuickstart() {
       const { projectType, enableAssistant } = workspaceQuestions;
       const contextSpinner = ora("Setting up Lovable workspace...").start();
 
-      const workspacePath = path.join(os.homedir(), "claude-mcp-workspace");
+      const workspacePath = getWorkspacePath();
       await fs.mkdir(workspacePath, { recursive: true });
 
       // Create enhanced workspace structure
@@ -369,14 +368,18 @@ async function setupQuickstart() {
         "usage-guides",
       ];
 
-      for (const dir of directories) {
-        await fs.mkdir(path.join(workspacePath, dir), { recursive: true });
-      }
+      // Sibling directories are independent, create them concurrently
+      await Promise.all(
+        directories.map((dir) =>
+          fs.mkdir(path.join(workspacePath, dir), { recursive: true })
+        )
+      );
 
       contextSpinner.text = "Copying Bootstrap Lovable v2 framework...";
 
-      // Copy entire bootstrap-lovable-v2 directory to workspace
-      const bootstrapSource = path.join(process.cwd(), "bootstrap-lovable-v2");
+      // Copy entire bootstrap-lovable-v2 directory to workspace. It ships with
+      // the package, so resolve it like the templates rather than from cwd
+      const bootstrapSource = path.join(__dirname, "bootstrap-lovable-v2");
       const bootstrapDest = path.join(workspacePath, "lovable-framework");
 
       try {
@@ -385,7 +388,7 @@ async function setupQuickstart() {
       } catch (error) {
         console.warn(
           chalk.yellow(
-            "Bootstrap Lovable v2 not found in current directory - creating basic structure"
+            "Bootstrap Lovable v2 not found in package - creating basic structure"
           )
         );
       }
@@ -399,7 +402,7 @@ async function setupQuickstart() {
         await createPromptLibrary(workspacePath);
       } else {
         // Create basic dev mode
-        await fs.writeFile(
+        await writeFileIfChanged(
           path.join(workspacePath, "DEV_MODE.md"),
           EXPERT_CONTEXT.dev_mode_trigger
         );
@@ -426,6 +429,9 @@ async function setupQuickstart() {
     const projectPath = process.cwd();
     const projectType = "Node.js"; // Could be enhanced to detect project type
 
+    const { default: initiateBrainConnection } = await import(
+      "./brain-connection.js"
+    );
     await initiateBrainConnection(projectPath, configuredServers, projectType);
   } catch (error) {
     spinner.fail("Setup failed");
@@ -440,10 +446,61 @@ async function setupQuickstart() {
   }
 }
 
+// Save config with atomic write. The pid suffix keeps concurrent runs from
+// sharing one temp file; since the name is unique per run, a failed write
+// or rename must remove it or it is left behind in the config directory
+async function writeConfigAtomically(configPath, config) {
+  const tempConfigPath = `${configPath}.${process.pid}.tmp`;
+
+  try {
+    await fs.writeFile(tempConfigPath, JSON.stringify(config, null, 2));
+    await fs.rename(tempConfigPath, configPath);
+  } catch (error) {
+    await fs.rm(tempConfigPath, { force: true });
+    throw error;
+  }
+}
+
 // Workspace creation helpers
+/**
+ * Writes content only when it differs from what is already on disk, so
+ * re-running setup leaves unchanged files (and their mtimes) untouched
+ */
+async function writeFileIfChanged(filePath, content) {
+  try {
+    if ((await fs.readFile(filePath, "utf-8")) === content) return;
+  } catch {
+    // Missing or unreadable, fall through and write it
+  }
+  await fs.writeFile(filePath, content);
+}
+
+/**
+ * True when dest already holds an identical copy of src. This is not
+ * cheaper than copying; it exists so a re-run leaves unchanged copies (and
+ * their mtimes) alone. Contents are compared because npm extracts package
+ * files with a fixed mtime, so timestamps cannot spot an upgraded source
+ */
+async function isCopyCurrent(srcPath, destPath) {
+  try {
+    // First run: dest is missing, so a single failed stat settles it
+    const destStat = await fs.stat(destPath);
+    const srcStat = await fs.stat(srcPath);
+    if (destStat.size !== srcStat.size) return false;
+
+    const [srcContent, destContent] = await Promise.all([
+      fs.readFile(srcPath),
+      fs.readFile(destPath),
+    ]);
+    return srcContent.equals(destContent);
+  } catch {
+    return false;
+  }
+}
+
 async function copyDirectory(src, dest) {
   try {
-    await fs.access(src);
+    // readdir rejects with ENOENT for a missing source, no separate probe needed
     const entries = await fs.readdir(src, { withFileTypes: true });
 
     await fs.mkdir(dest, { recursive: true });
@@ -454,7 +511,8 @@ async function copyDirectory(src, dest) {
 
       if (entry.isDirectory()) {
         await copyDirectory(srcPath, destPath);
-      } else {
+      } else if (!(await isCopyCurrent(srcPath, destPath))) {
+        // Re-running setup leaves an existing, unchanged copy alone
         await fs.copyFile(srcPath, destPath);
       }
     }
@@ -468,7 +526,6 @@ async function readTemplate(templateName) {
   const templatePath = path.join(__dirname, "templates", templateName);
 
   try {
-    await fs.access(templatePath);
     return await fs.readFile(templatePath, "utf8");
   } catch (error) {
     if (error.code === "ENOENT") {
@@ -491,9 +548,8 @@ function maskToken(token) {
   );
 }
 
-async function loadExistingConfig() {
+async function loadExistingConfig(configPath = getConfigPath()) {
   try {
-    const configPath = getConfigPath();
     const configContent = await fs.readFile(configPath, "utf8");
 
     // Safely parse JSON with proper error handling
@@ -547,10 +603,12 @@ function getExistingToken(existingConfig, serverName) {
       tavily: ["TAVILY_API_KEY"],
     };
 
+    const { env } = server;
     const possibleKeys = tokenKeys[serverName] || [];
     for (const key of possibleKeys) {
-      if (server.env[key]) {
-        return server.env[key];
+      const value = env[key];
+      if (value) {
+        return value;
       }
     }
   } else if (
@@ -594,20 +652,20 @@ function withSecureToken(token, callback) {
   }
 }
 
+// Basic token validation patterns, compiled once at module load
+const TOKEN_PATTERNS = {
+  supabase: /^sb[a-z]_[a-zA-Z0-9_-]+$/,
+  brave: /^[A-Z0-9]{32,}$/,
+  tavily: /^tvly-[a-zA-Z0-9_-]{20,}$/,
+};
+
 // Validate token format for basic security
 function validateToken(token, serverType) {
   if (!token || typeof token !== "string") {
     return false;
   }
 
-  // Basic validation patterns
-  const patterns = {
-    supabase: /^sb[a-z]_[a-zA-Z0-9_-]+$/,
-    brave: /^[A-Z0-9]{32,}$/,
-    tavily: /^tvly-[a-zA-Z0-9_-]{20,}$/,
-  };
-
-  const pattern = patterns[serverType];
+  const pattern = TOKEN_PATTERNS[serverType];
   return pattern ? pattern.test(token) : token.length >= 8;
 }
 
@@ -649,7 +707,7 @@ function validateAndMergeConfig(existingConfig, newServers) {
 async function createAIActivation(workspacePath) {
   await fs.mkdir(path.join(workspacePath, "ai-context"), { recursive: true });
   const template = await readTemplate("ai-activation.md");
-  await fs.writeFile(
+  await writeFileIfChanged(
     path.join(workspacePath, "ai-context", "AI_ACTIVATION.md"),
     template
   );
@@ -657,7 +715,7 @@ async function createAIActivation(workspacePath) {
 
 async function createLovablePatterns(workspacePath) {
   const template = await readTemplate("lovable-patterns.md");
-  await fs.writeFile(
+  await writeFileIfChanged(
     path.join(workspacePath, "ai-context", "LOVABLE_PATTERNS.md"),
     template
   );
@@ -665,7 +723,7 @@ async function createLovablePatterns(workspacePath) {
 
 async function createPromptLibrary(workspacePath) {
   const template = await readTemplate("prompt-library.md");
-  await fs.writeFile(
+  await writeFileIfChanged(
     path.join(workspacePath, "ai-context", "PROMPT_LIBRARY.md"),
     template
   );
@@ -679,7 +737,7 @@ async function createProjectTemplates(workspacePath, projectType) {
   const template = await readTemplate(
     `project-templates/${projectType}-template.md`
   );
-  await fs.writeFile(
+  await writeFileIfChanged(
     path.join(workspacePath, "project-templates", `${projectType}-template.md`),
     template
   );
@@ -687,7 +745,10 @@ async function createProjectTemplates(workspacePath, projectType) {
 
 async function createUsageGuides(workspacePath, projectType, enableAssistant) {
   const template = await readTemplate("usage-guide.md");
-  await fs.writeFile(path.join(workspacePath, "USAGE_GUIDE.md"), template);
+  await writeFileIfChanged(
+    path.join(workspacePath, "USAGE_GUIDE.md"),
+    template
+  );
 }
 
 async function createMasterContext(
@@ -763,40 +824,37 @@ claude-mcp-workspace/
 
 Ready for development assistance.`;
 
-  await fs.writeFile(path.join(workspacePath, "CONTEXT.md"), contextContent);
+  await writeFileIfChanged(
+    path.join(workspacePath, "CONTEXT.md"),
+    contextContent
+  );
 }
 
-export function generateServerConfig(serverType, options = {}) {
-  const {
-    workspacePath,
-    githubToken,
-    supabaseKey,
-    context7ApiKey,
-    braveKey,
-    tavilyKey,
-  } = options;
-
-  const configs = {
-    filesystem: {
-      command: "npx",
-      args: [
-        "-y",
-        "@modelcontextprotocol/server-filesystem",
-        workspacePath || path.join(os.homedir(), "claude-mcp-workspace"),
-      ],
-    },
-    memory: {
-      command: "npx",
-      args: ["-y", "@modelcontextprotocol/server-memory"],
-    },
-    github: githubToken
+// Config builders keyed by server type. Only the requested entry is
+// materialized, so unrelated paths and args are never constructed.
+const SERVER_CONFIG_BUILDERS = {
+  filesystem: ({ workspacePath }) => ({
+    command: "npx",
+    args: [
+      "-y",
+      "@modelcontextprotocol/server-filesystem",
+      workspacePath || getWorkspacePath(),
+    ],
+  }),
+  memory: () => ({
+    command: "npx",
+    args: ["-y", "@modelcontextprotocol/server-memory"],
+  }),
+  github: ({ githubToken }) =>
+    githubToken
       ? {
           command: "npx",
           args: ["-y", "@modelcontextprotocol/server-github"],
           env: { GITHUB_TOKEN: githubToken },
         }
       : null,
-    supabase: supabaseKey
+  supabase: ({ supabaseKey }) =>
+    supabaseKey
       ? {
           command: "npx",
           args: [
@@ -806,29 +864,36 @@ export function generateServerConfig(serverType, options = {}) {
           ],
         }
       : null,
-    context7: context7ApiKey
+  context7: ({ context7ApiKey }) =>
+    context7ApiKey
       ? {
           command: "npx",
           args: ["-y", "@upstash/context7-mcp", "--api-key", context7ApiKey],
         }
       : null,
-    brave: braveKey
+  brave: ({ braveKey }) =>
+    braveKey
       ? {
           command: "npx",
           args: ["-y", "@brave/brave-search-mcp-server"],
           env: { BRAVE_API_KEY: braveKey },
         }
       : null,
-    tavily: tavilyKey
+  tavily: ({ tavilyKey }) =>
+    tavilyKey
       ? {
           command: "npx",
           args: ["-y", "tavily-mcp"],
           env: { TAVILY_API_KEY: tavilyKey },
         }
       : null,
-  };
+};
 
-  return configs[serverType];
+export function generateServerConfig(serverType, options = {}) {
+  if (!Object.hasOwn(SERVER_CONFIG_BUILDERS, serverType)) {
+    return undefined;
+  }
+  return SERVER_CONFIG_BUILDERS[serverType](options);
 }
 
 export function getConfigPath() {
@@ -845,7 +910,17 @@ export function getWorkspacePath() {
   return path.join(os.homedir(), "claude-mcp-workspace");
 }
 
-export { readTemplate };
+export {
+  copyDirectory,
+  readTemplate,
+  maskToken,
+  loadExistingConfig,
+  validateAndMergeConfig,
+  validateToken,
+  withSecureToken,
+  writeConfigAtomically,
+  writeFileIfChanged,
+};
 
 // Run setup
 if (import.meta.url === `file://${process.argv[1]}`) {
@@ -1,9 +1,13 @@
-import { describe, test, expect, vi } from "vitest";
+import { describe, test, expect, vi, beforeEach, afterEach } from "vitest";
 import {
+  copyDirectory,
   generateServerConfig,
   getConfigPath,
   getWorkspacePath,
   readTemplate,
+  validateToken as validateSetupToken,
+  writeConfigAtomically,
+  writeFileIfChanged,
 } from "./setup.js";
 import {
   maskToken,
@@ -19,6 +23,7 @@ import {
 import path from "path";
 import os from "os";
 import fs from "fs/promises";
+import { dir as tmpdir } from "tmp-promise";
 
 describe("generateServerConfig", () => {
   test("creates filesystem server config with default workspace", () => {
@@ -190,6 +195,10 @@ describe("maskToken", () => {
 });
 
 describe("loadExistingConfig", () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
   test("returns parsed config when file exists", async () => {
     const mockConfig = {
       mcpServers: {
@@ -465,6 +474,34 @@ describe("validateToken", () => {
   });
 });
 
+// setup.js keeps its own validateToken (no GitHub pattern); the block above
+// covers the test-utils copy
+describe("validateToken (setup.js)", () => {
+  test("validates Supabase, Brave and Tavily token formats", () => {
+    expect(validateSetupToken("sbp_test123", "supabase")).toBe(true);
+    expect(validateSetupToken("invalid-token", "supabase")).toBe(false);
+    expect(
+      validateSetupToken("ABCDEFGHIJKLMNOPQRSTUVWXYZ123456", "brave")
+    ).toBe(true);
+    expect(validateSetupToken("lowercase-key", "brave")).toBe(false);
+    expect(
+      validateSetupToken("tvly-abcdefghijklmnopqrstuvwxyz123456", "tavily")
+    ).toBe(true);
+    expect(validateSetupToken("invalid-tavily-key", "tavily")).toBe(false);
+  });
+
+  test("falls back to a length check for other server types", () => {
+    expect(validateSetupToken("longenoughtoken", "unknown")).toBe(true);
+    expect(validateSetupToken("short", "unknown")).toBe(false);
+  });
+
+  test("rejects invalid token types", () => {
+    expect(validateSetupToken(null, "supabase")).toBe(false);
+    expect(validateSetupToken(123, "supabase")).toBe(false);
+    expect(validateSetupToken("", "unknown")).toBe(false);
+  });
+});
+
 describe("validateAndMergeConfig", () => {
   test("merges valid configurations", () => {
     const existingConfig = createMockConfig({
@@ -560,4 +597,145 @@ describe("withSecureToken", () => {
   });
 });
 
+describe("copyDirectory", () => {
+  let tempDir;
+  let src;
+  let dest;
+
+  beforeEach(async () => {
+    tempDir = await tmpdir({ unsafeCleanup: true });
+    src = path.join(tempDir.path, "src");
+    dest = path.join(tempDir.path, "dest");
+    await fs.mkdir(path.join(src, "nested"), { recursive: true });
+    await fs.writeFile(path.join(src, "README.md"), "aaaa");
+    await fs.writeFile(path.join(src, "nested", "guide.md"), "guide");
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    await tempDir.cleanup();
+  });
+
+  test("copies files recursively", async () => {
+    await copyDirectory(src, dest);
+
+    expect(await fs.readFile(path.join(dest, "README.md"), "utf-8")).toBe(
+      "aaaa"
+    );
+    expect(
+      await fs.readFile(path.join(dest, "nested", "guide.md"), "utf-8")
+    ).toBe("guide");
+  });
+
+  test("skips files whose copy is already identical", async () => {
+    await copyDirectory(src, dest);
+    const copySpy = vi.spyOn(fs, "copyFile");
+
+    await copyDirectory(src, dest);
+
+    expect(copySpy).not.toHaveBeenCalled();
+  });
+
+  test("re-copies same-size files whose content changed", async () => {
+    await copyDirectory(src, dest);
+
+    // npm extracts package files with a fixed 1985 mtime, so an upgraded
+    // source looks older than the existing copy
+    const npmEpoch = new Date("1985-10-26T08:15:00Z");
+    await fs.writeFile(path.join(src, "README.md"), "bbbb");
+    await fs.utimes(path.join(src, "README.md"), npmEpoch, npmEpoch);
+
+    await copyDirectory(src, dest);
+
+    expect(await fs.readFile(path.join(dest, "README.md"), "utf-8")).toBe(
+      "bbbb"
+    );
+  });
+
+  test("restores a same-size copy edited by the user", async () => {
+    await copyDirectory(src, dest);
+    await fs.writeFile(path.join(dest, "README.md"), "zzzz");
+
+    await copyDirectory(src, dest);
+
+    expect(await fs.readFile(path.join(dest, "README.md"), "utf-8")).toBe(
+      "aaaa"
+    );
+  });
+});
+
+describe("writeConfigAtomically", () => {
+  let tempDir;
+  let configPath;
+
+  beforeEach(async () => {
+    tempDir = await tmpdir({ unsafeCleanup: true });
+    configPath = path.join(tempDir.path, "claude_desktop_config.json");
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    await tempDir.cleanup();
+  });
+
+  test("writes the config and leaves no temp file behind", async () => {
+    const config = { mcpServers: { memory: {} } };
+
+    await writeConfigAtomically(configPath, config);
+
+    expect(JSON.parse(await fs.readFile(configPath, "utf-8"))).toEqual(config);
+    expect(await fs.readdir(tempDir.path)).toEqual([
+      "claude_desktop_config.json",
+    ]);
+  });
+
+  test("removes the temp file when the rename fails", async () => {
+    vi.spyOn(fs, "rename").mockRejectedValue(new Error("EXDEV"));
+
+    await expect(
+      writeConfigAtomically(configPath, { mcpServers: {} })
+    ).rejects.toThrow("EXDEV");
+
+    expect(await fs.readdir(tempDir.path)).toEqual([]);
+  });
+});
+
+describe("writeFileIfChanged", () => {
+  let tempDir;
+  let filePath;
+
+  beforeEach(async () => {
+    tempDir = await tmpdir({ unsafeCleanup: true });
+    filePath = path.join(tempDir.path, "CONTEXT.md");
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    await tempDir.cleanup();
+  });
+
+  test("writes a file that does not exist yet", async () => {
+    await writeFileIfChanged(filePath, "# Context");
+
+    expect(await fs.readFile(filePath, "utf-8")).toBe("# Context");
+  });
+
+  test("leaves a file with identical content untouched", async () => {
+    await fs.writeFile(filePath, "# Context");
+    const writeSpy = vi.spyOn(fs, "writeFile");
+
+    await writeFileIfChanged(filePath, "# Context");
+
+    expect(writeSpy).not.toHaveBeenCalled();
+  });
+
+  test("rewrites a file whose content changed", async () => {
+    await fs.writeFile(filePath, "# Old context");
+
+    await writeFileIfChanged(filePath, "# New context");
+
+    expect(await fs.readFile(filePath, "utf-8")).toBe("# New context");
+  });
+});
+
 // Template tests moved to template.spec.js to avoid fs mocking conflicts
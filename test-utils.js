@@ -1,48 +1,16 @@
 // Test utilities for MCP Quickstart
 // This file provides test-specific implementations and helpers
 
-import fs from "fs/promises";
-import { getConfigPath } from "./setup.js";
-import chalk from "chalk";
-
-// Re-implement functions for testing (mirroring internal implementations)
-export function maskToken(token) {
-  if (!token || token.length < 8) return token;
-  return (
-    token.substring(0, 5) +
-    "*".repeat(token.length - 8) +
-    token.substring(token.length - 3)
-  );
-}
-
-export async function loadExistingConfig() {
-  try {
-    const configPath = getConfigPath();
-    const configContent = await fs.readFile(configPath, "utf8");
-
-    // Safely parse JSON with proper error handling
-    try {
-      const config = JSON.parse(configContent);
-      // Validate basic structure
-      if (!config || typeof config !== "object") {
-        throw new Error("Invalid config structure");
-      }
-      return {
-        mcpServers: config.mcpServers || {},
-        ...config,
-      };
-    } catch (parseError) {
-      console.warn(
-        chalk.yellow(`Invalid JSON in config file: ${parseError.message}`)
-      );
-      return { mcpServers: {} };
-    }
-  } catch (error) {
-    // File doesn't exist or can't be read
-    return { mcpServers: {} };
-  }
-}
-
+// Shared helpers come straight from setup.js so tests exercise the real code
+export {
+  maskToken,
+  loadExistingConfig,
+  validateAndMergeConfig,
+  withSecureToken,
+} from "./setup.js";
+
+// Token helpers below also cover GitHub tokens, which setup.js no longer
+// configures, so they are kept as test-side implementations
 export function getExistingToken(existingConfig, serverName) {
   const server = existingConfig.mcpServers?.[serverName];
   if (!server) {
@@ -72,10 +40,12 @@ export function getExistingToken(existingConfig, serverName) {
       tavily: ["TAVILY_API_KEY"],
     };
 
+    const { env } = server;
     const possibleKeys = tokenKeys[serverName] || [];
     for (const key of possibleKeys) {
-      if (server.env[key]) {
-        return server.env[key];
+      const value = env[key];
+      if (value) {
+        return value;
       }
     }
   } else if (
@@ -98,69 +68,24 @@ export function getExistingToken(existingConfig, serverName) {
   return null;
 }
 
+// Basic validation patterns; unlike setup.js this copy also knows GitHub
+// tokens, which the specs still exercise
+const TOKEN_PATTERNS = {
+  github: /^(gh[ps]_[a-zA-Z0-9]{36,40}|[a-f0-9]{40})$/,
+  supabase: /^sb[a-z]_[a-zA-Z0-9_-]+$/,
+  brave: /^[A-Z0-9]{32,}$/,
+  tavily: /^tvly-[a-zA-Z0-9_-]{20,}$/,
+};
+
 export function validateToken(token, serverType) {
   if (!token || typeof token !== "string") {
     return false;
   }
 
-  // Basic validation patterns
-  const patterns = {
-    github: /^(gh[ps]_[a-zA-Z0-9]{36,40}|[a-f0-9]{40})$/,
-    supabase: /^sb[a-z]_[a-zA-Z0-9_-]+$/,
-    brave: /^[A-Z0-9]{32,}$/,
-    tavily: /^tvly-[a-zA-Z0-9_-]{20,}$/,
-  };
-
-  const pattern = patterns[serverType];
+  const pattern = TOKEN_PATTERNS[serverType];
   return pattern ? pattern.test(token) : token.length >= 8;
 }
 
-export function validateAndMergeConfig(existingConfig, newServers) {
-  // Validate existing config structure
-  if (!existingConfig || typeof existingConfig !== "object") {
-    throw new Error("Invalid existing configuration");
-  }
-
-  // Ensure mcpServers exists
-  if (
-    !existingConfig.mcpServers ||
-    typeof existingConfig.mcpServers !== "object"
-  ) {
-    existingConfig.mcpServers = {};
-  }
-
-  // Validate new servers
-  for (const [serverName, serverConfig] of Object.entries(newServers)) {
-    if (!serverConfig || typeof serverConfig !== "object") {
-      throw new Error(`Invalid configuration for server: ${serverName}`);
-    }
-
-    if (!serverConfig.command || !Array.isArray(serverConfig.args)) {
-      throw new Error(
-        `Invalid server configuration structure for: ${serverName}`
-      );
-    }
-  }
-
-  // Safe merge
-  return {
-    ...existingConfig,
-    mcpServers: { ...existingConfig.mcpServers, ...newServers },
-  };
-}
-
-export function withSecureToken(token, callback) {
-  try {
-    return callback(token);
-  } finally {
-    // Clear token (best effort in JavaScript)
-    token = null;
-    if (global.gc) {
-      global.gc();
-    }
-  }
-}
-
 // Test-specific helpers
 export function createMockConfig(servers = {}) {
   return {